@@ -20,14 +20,18 @@ For loading previously serialized evidence from JSON:
     from src import load_evidence_from_json
     evidence = load_evidence_from_json(json_data)
 
+    # Or straight from raw bytes, skipping json.loads()
+    from src import load_evidence_from_json_bytes
+    evidence = load_evidence_from_json_bytes(raw_bytes)
+
 For schema types (type hints, manual construction):
 
     from src.schema import CommitObservation, IOC, EvidenceSource
 """
 
-from typing import Annotated, Union
+from typing import Annotated, Any, Union
 
-from pydantic import Field, TypeAdapter
+from pydantic import Discriminator, Field, Tag, TypeAdapter
 
 from .store import EvidenceStore
 
@@ -67,27 +71,65 @@ from .schema.common import EvidenceSource, IOCType
 # Combined type alias
 AnyEvidence = AnyEvent | AnyObservation
 
-# Pydantic discriminated unions for efficient JSON deserialization
-_EventUnion = Annotated[
-    Union[
-        PushEvent, PullRequestEvent, IssueEvent, IssueCommentEvent,
-        CreateEvent, DeleteEvent, ForkEvent, WorkflowRunEvent,
-        ReleaseEvent, WatchEvent, MemberEvent, PublicEvent,
-    ],
-    Field(discriminator="event_type"),
-]
+_EVENT_TYPES = (
+    PushEvent, PullRequestEvent, IssueEvent, IssueCommentEvent,
+    CreateEvent, DeleteEvent, ForkEvent, WorkflowRunEvent,
+    ReleaseEvent, WatchEvent, MemberEvent, PublicEvent,
+)
+
+_OBSERVATION_TYPES = (
+    CommitObservation, IssueObservation, FileObservation, ForkObservation,
+    BranchObservation, TagObservation, ReleaseObservation, SnapshotObservation,
+    IOC, ArticleObservation,
+)
+
+
+# Pydantic discriminated unions for efficient JSON deserialization. String
+# discriminators let pydantic-core read the tag straight from raw JSON; each
+# member's tag comes from its Literal default.
+_EventUnion = Annotated[Union[_EVENT_TYPES], Field(discriminator="event_type")]
+_ObservationUnion = Annotated[Union[_OBSERVATION_TYPES], Field(discriminator="observation_type")]
 
-_ObservationUnion = Annotated[
+
+def _evidence_discriminator(value: Any) -> str | None:
+    """Tag raw dicts and model instances as 'event' or 'observation'."""
+    if isinstance(value, dict):
+        if "event_type" in value:
+            return "event"
+        if "observation_type" in value:
+            return "observation"
+        return None
+    if hasattr(value, "event_type"):
+        return "event"
+    if hasattr(value, "observation_type"):
+        return "observation"
+    return None
+
+
+# One top-level union so pydantic-core dispatches both levels itself
+_EvidenceUnion = Annotated[
     Union[
-        CommitObservation, IssueObservation, FileObservation, ForkObservation,
-        BranchObservation, TagObservation, ReleaseObservation, SnapshotObservation,
-        IOC, ArticleObservation,
+        Annotated[_EventUnion, Tag("event")],
+        Annotated[_ObservationUnion, Tag("observation")],
     ],
-    Field(discriminator="observation_type"),
+    Discriminator(
+        _evidence_discriminator,
+        custom_error_type="invalid_evidence",
+        custom_error_message="Data must contain 'event_type' or 'observation_type' field",
+    ),
 ]
 
-_event_adapter = TypeAdapter(_EventUnion)
-_observation_adapter = TypeAdapter(_ObservationUnion)
+# Adapters are built once at import time and shared by every loader
+EVIDENCE_ADAPTER = TypeAdapter(_EvidenceUnion)
+EVENT_ADAPTER = TypeAdapter(_EventUnion)
+OBSERVATION_ADAPTER = TypeAdapter(_ObservationUnion)
+
+_EVIDENCE_LIST_ADAPTER = TypeAdapter(list[_EvidenceUnion])
+
+# For raw JSON arrays: the callable top-level discriminator would make
+# pydantic-core build Python objects before dispatching, so JSON items go
+# through a plain union whose members read their string tags from the JSON.
+_EVIDENCE_JSON_LIST_ADAPTER = TypeAdapter(list[Union[_EventUnion, _ObservationUnion]])
 
 
 def load_evidence_from_json(data: dict) -> AnyEvidence:
@@ -102,20 +144,56 @@ def load_evidence_from_json(data: dict) -> AnyEvidence:
 
     Raises:
         ValueError: If the data cannot be parsed into a known evidence type
+            (pydantic.ValidationError is a ValueError subclass)
+    """
+    return EVIDENCE_ADAPTER.validate_python(data)
+
+
+def load_evidence_batch(items: list[dict]) -> list[AnyEvidence]:
+    """
+    Load many serialized evidence objects at once.
+
+    The whole list is validated in one adapter call, so discriminator
+    dispatch runs inside pydantic-core rather than once per item in
+    Python. Input order is preserved.
+
+    Raises:
+        ValueError: If any item cannot be parsed into a known evidence type
+    """
+    return _EVIDENCE_LIST_ADAPTER.validate_python(items)
+
+
+def load_evidence_from_json_bytes(raw: bytes | str) -> AnyEvidence:
+    """
+    Load a serialized evidence object straight from raw JSON.
+
+    The event or observation adapter is picked by a cheap substring test
+    for the type key, and its string discriminator reads the tag from the
+    raw JSON, so parsing and validation happen in a single pydantic-core
+    pass with no intermediate Python dict.
+
+    Raises:
+        ValueError: If the data cannot be parsed into a known evidence type
+    """
+    as_bytes = isinstance(raw, bytes)
+    if (b'"event_type"' if as_bytes else '"event_type"') in raw:
+        return EVENT_ADAPTER.validate_json(raw)
+    if (b'"observation_type"' if as_bytes else '"observation_type"') in raw:
+        return OBSERVATION_ADAPTER.validate_json(raw)
+    return EVIDENCE_ADAPTER.validate_json(raw)  # Neither key: fails with the usual message
+
+
+def load_evidence_batch_from_json_bytes(raw: bytes | str) -> list[AnyEvidence]:
     """
-    if "event_type" in data:
-        try:
-            return _event_adapter.validate_python(data)
-        except Exception as e:
-            raise ValueError(f"Unknown event_type: {data.get('event_type')}") from e
+    Load a JSON array of serialized evidence (e.g. an EvidenceStore file).
 
-    if "observation_type" in data:
-        try:
-            return _observation_adapter.validate_python(data)
-        except Exception as e:
-            raise ValueError(f"Unknown observation_type: {data.get('observation_type')}") from e
+    The whole array is parsed and validated by pydantic-core in one call,
+    without building intermediate Python dicts.
 
-    raise ValueError("Data must contain 'event_type' or 'observation_type' field")
+    Raises:
+        ValueError: If any item cannot be parsed into a known evidence type
+    """
+    return _EVIDENCE_JSON_LIST_ADAPTER.validate_json(raw)
 
 
 # Public API - minimal surface area
@@ -123,6 +201,13 @@ __all__ = [
     # Main entry points
     "EvidenceStore",
     "load_evidence_from_json",
+    "load_evidence_batch",
+    "load_evidence_from_json_bytes",
+    "load_evidence_batch_from_json_bytes",
+    # Shared pydantic adapters
+    "EVIDENCE_ADAPTER",
+    "EVENT_ADAPTER",
+    "OBSERVATION_ADAPTER",
     # Type aliases (for type hints)
     "AnyEvidence",
     "AnyEvent",
@@ -5,14 +5,21 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import google.auth
+from google.auth.exceptions import DefaultCredentialsError
 from google.cloud import bigquery
 from google.oauth2 import service_account
 
 from ..schema.common import EvidenceSource
 
+# Upper bound on bytes a verification query may bill; BigQuery fails the
+# job instead of running it if the estimate exceeds this.
+MAXIMUM_BYTES_BILLED = 10 * 1024**3
+
 
 class GHArchiveClient:
     """Client for GH Archive BigQuery queries.
@@ -27,6 +34,9 @@ class GHArchiveClient:
     def __init__(self, project_id: str | None = None):
         self.project_id = project_id
         self._client: bigquery.Client | None = None
+        self._credentials: tuple[Any, str | None] | None = None
+        self._credentials_available: bool | None = None
+        self._credentials_lock = threading.Lock()
 
     @property
     def source(self) -> EvidenceSource:
@@ -34,13 +44,33 @@ class GHArchiveClient:
 
     def _get_client(self) -> bigquery.Client:
         if self._client is None:
-            credentials, project = self._resolve_credentials()
+            credentials, project = self._credentials or self._resolve_credentials()
             self._client = bigquery.Client(
                 credentials=credentials,
                 project=self.project_id or project,
             )
         return self._client
 
+    def has_credentials(self) -> bool:
+        """Whether credentials and a project for BigQuery can be resolved.
+
+        Resolves credentials in-process without building a BigQuery client,
+        and only once per client; the outcome (including "unavailable") is
+        remembered so callers sharing this client never re-probe. Credentials
+        without a project (and no project_id given) count as unavailable,
+        since bigquery.Client could not be built from them.
+        """
+        with self._credentials_lock:
+            if self._credentials_available is None:
+                try:
+                    credentials, project = self._resolve_credentials()
+                except (DefaultCredentialsError, ValueError):
+                    self._credentials_available = False
+                else:
+                    self._credentials = (credentials, project)
+                    self._credentials_available = bool(self.project_id or project)
+            return self._credentials_available
+
     def _resolve_credentials(self) -> tuple[Any, str | None]:
         """Resolve credentials - supports file path or inline JSON."""
         scopes = ["https://www.googleapis.com/auth/bigquery"]
@@ -118,3 +148,84 @@ class GHArchiveClient:
         job_config = bigquery.QueryJobConfig(query_parameters=params)
         results = client.query(query, job_config=job_config)
         return [dict(row) for row in results]
+
+    def event_exists(
+        self,
+        repo: str | None = None,
+        actor: str | None = None,
+        minute: str = "",
+    ) -> bool:
+        """Whether any event matches repo/actor during a YYYYMMDDHHMM minute.
+
+        Existence-only counterpart of query_events: selects a constant with
+        LIMIT 1 so BigQuery can stop at the first match and no rows are
+        shipped back.
+        """
+        day = minute[:8]
+        if not minute.isdigit() or len(minute) != 12:
+            raise ValueError(f"Invalid date format: {minute}")
+        table = f"`githubarchive.day.{day}`"
+
+        start = datetime(
+            int(minute[:4]), int(minute[4:6]), int(minute[6:8]),
+            int(minute[8:10]), int(minute[10:12]), tzinfo=timezone.utc,
+        )
+        clauses = ["created_at >= @start", "created_at < @end"]
+        params = [
+            bigquery.ScalarQueryParameter("start", "TIMESTAMP", start),
+            bigquery.ScalarQueryParameter("end", "TIMESTAMP", start + timedelta(minutes=1)),
+        ]
+        if repo:
+            clauses.append("repo.name = @repo")
+            params.append(bigquery.ScalarQueryParameter("repo", "STRING", repo))
+        if actor:
+            clauses.append("actor.login = @actor")
+            params.append(bigquery.ScalarQueryParameter("actor", "STRING", actor))
+
+        query = f"""
+        SELECT 1
+        FROM {table}
+        WHERE {" AND ".join(clauses)}
+        LIMIT 1
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=params,
+            maximum_bytes_billed=MAXIMUM_BYTES_BILLED,
+        )
+        results = self._get_client().query(query, job_config=job_config)
+        return any(True for _ in results)
+
+    def query_events_batch(self, filters: list[tuple[str, str, str]]) -> set[tuple[str, str, str]]:
+        """Check many (repo, actor, YYYYMMDDHHMM) keys with a single query.
+
+        All filters must fall on the same day so one daily table is scanned.
+        Returns the subset of keys that have at least one matching event.
+        """
+        if not filters:
+            return set()
+
+        days = {ts[:8] for _, _, ts in filters}
+        if len(days) != 1:
+            raise ValueError(f"Batch filters must share one day, got: {sorted(days)}")
+        day = days.pop()
+        if not day.isdigit() or len(day) != 8:
+            raise ValueError(f"Invalid date format: {day}")
+        table = f"`githubarchive.day.{day}`"
+
+        # Repo names and logins cannot contain '|', so the joined key is unambiguous
+        keys = sorted({f"{repo}|{actor}|{ts[:12]}" for repo, actor, ts in filters})
+
+        query = f"""
+        SELECT DISTINCT
+            CONCAT(repo.name, '|', actor.login, '|', FORMAT_TIMESTAMP('%Y%m%d%H%M', created_at)) as event_key
+        FROM {table}
+        WHERE CONCAT(repo.name, '|', actor.login, '|', FORMAT_TIMESTAMP('%Y%m%d%H%M', created_at)) IN UNNEST(@keys)
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ArrayQueryParameter("keys", "STRING", keys)],
+            maximum_bytes_billed=MAXIMUM_BYTES_BILLED,
+        )
+        results = self._get_client().query(query, job_config=job_config)
+        return {tuple(row["event_key"].split("|")) for row in results}
@@ -1,24 +1,174 @@
 """
-GitHub API Client (Unauthenticated).
+GitHub API Client (REST and GraphQL; authenticated when a token is set).
 """
 from __future__ import annotations
 
-from typing import Any
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterator, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..schema.common import EvidenceSource
 
+# Keep-alive connections kept per host; covers the verifier's largest default
+# concurrency (averify_many), so parallel workers never overflow the pool
+SESSION_POOL_SIZE = 64
+
+# Bytes per chunk when streaming raw file content
+RAW_CHUNK_SIZE = 64 * 1024
+
+# Most recently used responses kept for ETag revalidation, and the largest
+# body (in bytes) worth keeping; bigger ones (large files, patches) are refetched
+ETAG_CACHE_MAXSIZE = 256
+ETAG_CACHE_MAX_BODY = 256 * 1024
+
+# Objects per GraphQL request in graphql_batch; keeps queries well under node limits
+GRAPHQL_BATCH_SIZE = 50
+
+# Shared field sets for graphql_batch; only fragments a query uses are sent
+_GRAPHQL_FRAGMENTS = {
+    "CommitFields": "fragment CommitFields on Commit { oid message author { name } }",
+    "IssueFields": "fragment IssueFields on Issue { number title state }",
+    "PullRequestFields": "fragment PullRequestFields on PullRequest { number title state }",
+    "RefFields": "fragment RefFields on Ref { target { oid } }",
+}
+
+# A graphql_batch key: (owner, repo, kind, key) where kind is one of
+# "commit" (key = sha), "issue" (number), "branch", "tag" or "release" (name)
+GraphQLKey = tuple[str, str, str, Any]
+
+# Pace a bucket once its remaining quota drops below this fraction of
+# X-RateLimit-Limit (e.g. 6 of 60 unauthenticated, 500 of 5,000 with a token)
+_RATE_LIMIT_PACING_FRACTION = 0.1
+
+# Bucket assumed for responses without X-RateLimit-Resource
+_DEFAULT_RATE_LIMIT_RESOURCE = "core"
+
+
+class _RateLimitBucket:
+    """Quota state for one X-RateLimit-Resource (e.g. "core" or "graphql")."""
+
+    def __init__(self) -> None:
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset_at: float = 0.0
+        self.paused_until: float = 0.0
+        self.next_slot: float = 0.0
+
+
+class RateLimiter:
+    """Paces GitHub requests using the rate-limit headers of each response.
+
+    Thread-safe; one instance is shared by every thread using a client.
+    Quota is tracked per X-RateLimit-Resource, so GraphQL and REST calls
+    never throttle each other. While plenty of a bucket's quota is left,
+    requests pass without waiting. Once X-RateLimit-Remaining drops below
+    a fraction of X-RateLimit-Limit, the remaining quota is spread over
+    the time left until X-RateLimit-Reset: each caller reserves the next
+    free send slot, so pacing holds across threads rather than per thread.
+    A 403/429 carrying Retry-After pauses all callers until it expires; an
+    exhausted quota pauses its bucket until reset.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.buckets: dict[str, _RateLimitBucket] = {}
+        # Secondary limits (Retry-After) are not tied to one bucket
+        self.paused_until: float = 0.0
+
+    def _bucket(self, resource: str) -> _RateLimitBucket:
+        bucket = self.buckets.get(resource)
+        if bucket is None:
+            bucket = self.buckets[resource] = _RateLimitBucket()
+        return bucket
+
+    def acquire(self, resource: str = _DEFAULT_RATE_LIMIT_RESOURCE) -> None:
+        """Block until this caller's reserved send slot in resource arrives."""
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(resource)
+            slot = max(now, self.paused_until, bucket.paused_until)
+            remaining, limit = bucket.remaining, bucket.limit
+            if (
+                remaining is not None
+                and limit is not None
+                and remaining < limit * _RATE_LIMIT_PACING_FRACTION
+                and bucket.reset_at > now
+            ):
+                interval = (bucket.reset_at - now) / max(remaining, 1)
+                slot = max(slot, bucket.next_slot)
+                bucket.next_slot = slot + interval
+        wait = slot - now
+        if wait > 0:
+            self._sleep(wait)
+
+    def update(self, resp: Any, resource: str = _DEFAULT_RATE_LIMIT_RESOURCE) -> bool:
+        """Record a response's rate-limit headers.
+
+        The bucket is taken from X-RateLimit-Resource, falling back to the
+        resource the request was sent against. Returns True if the response
+        was rejected by a rate limit and the request should be retried once
+        the pause has elapsed.
+        """
+        headers = resp.headers
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(headers.get("X-RateLimit-Resource") or resource)
+            if "X-RateLimit-Limit" in headers:
+                bucket.limit = int(headers["X-RateLimit-Limit"])
+            if "X-RateLimit-Remaining" in headers:
+                bucket.remaining = int(headers["X-RateLimit-Remaining"])
+            if "X-RateLimit-Reset" in headers:
+                bucket.reset_at = float(headers["X-RateLimit-Reset"])
+
+            if resp.status_code not in (403, 429):
+                return False
+            if "Retry-After" in headers:
+                self.paused_until = max(self.paused_until, now + float(headers["Retry-After"]))
+                return True
+            if bucket.remaining == 0:
+                bucket.paused_until = max(bucket.paused_until, bucket.reset_at)
+                return True
+            return False
+
 
 class GitHubClient:
-    """Client for GitHub REST API (unauthenticated OSINT).
+    """Client for the GitHub REST and GraphQL APIs.
 
-    Rate limits: 60 requests/hour unauthenticated.
-    All public repository data is accessible without authentication.
+    Without a token, requests are unauthenticated: 60 requests/hour, and
+    all public repository data is accessible.
+
+    A token is taken from the argument or, when none is passed, from the
+    GITHUB_TOKEN env var, and is sent on every REST call as well as GraphQL
+    (which always requires auth). That raises the REST limit to the token's
+    quota (5,000/hour for a personal token) and lets REST calls see whatever
+    the token can, e.g. private repositories. Pass token="" to stay
+    unauthenticated even when GITHUB_TOKEN is set.
     """
 
     BASE_URL = "https://api.github.com"
+    GRAPHQL_URL = "https://api.github.com/graphql"
 
-    def __init__(self):
+    def __init__(self, token: str | None = None):
+        self.token = token if token is not None else os.environ.get("GITHUB_TOKEN") or None
         self._session: Any = None
+        self._session_lock = threading.Lock()
+        self.rate_limiter = RateLimiter()
+        # Conditional-request LRU cache: request key -> (ETag, parsed body)
+        self.etag_cache: OrderedDict[tuple[str, tuple], tuple[str, Any]] = OrderedDict()
+        self._etag_lock = threading.Lock()
 
     @property
     def source(self) -> EvidenceSource:
@@ -26,96 +176,235 @@ class GitHubClient:
 
     def _get_session(self) -> Any:
         if self._session is None:
-            import requests
-            from requests.adapters import HTTPAdapter
-            from urllib3.util.retry import Retry
-
-            self._session = requests.Session()
-            self._session.headers.update({"Accept": "application/vnd.github+json"})
-            
-            # Add retry logic
-            retries = Retry(
-                total=3,
-                backoff_factor=1,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["GET"]
-            )
-            adapter = HTTPAdapter(max_retries=retries)
-            self._session.mount("https://", adapter)
-            self._session.mount("http://", adapter)
-            
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    session.headers.update({"Accept": "application/vnd.github+json"})
+                    if self.token:
+                        session.headers["Authorization"] = f"Bearer {self.token}"
+
+                    # Add retry logic; 429s are left to the shared rate limiter
+                    retries = Retry(
+                        total=3,
+                        backoff_factor=1,
+                        status_forcelist=[500, 502, 503, 504],
+                        allowed_methods=["GET"]
+                    )
+                    # Pool sized for threaded verification sharing one client
+                    adapter = HTTPAdapter(pool_maxsize=SESSION_POOL_SIZE, max_retries=retries)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+
         return self._session
 
+    def _request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request through the rate limiter, retrying once if throttled."""
+        session = self._get_session()
+        resource = "graphql" if url == self.GRAPHQL_URL else _DEFAULT_RATE_LIMIT_RESOURCE
+        for attempt in range(2):
+            self.rate_limiter.acquire(resource)
+            resp = session.request(method, url, **kwargs)
+            if not self.rate_limiter.update(resp, resource) or attempt:
+                break
+            resp.close()  # Release the pooled connection (may be streamed) before retrying
+        resp.raise_for_status()
+        return resp
+
+    def _get_json(self, url: str, params: dict[str, Any] | None = None) -> Any:
+        """GET a REST resource, revalidating any cached copy with its ETag.
+
+        A 304 Not Modified reply carries no body and does not count against
+        the primary rate limit, so unchanged resources cost almost nothing
+        on repeat verification passes. The cache keeps the
+        ETAG_CACHE_MAXSIZE most recently used bodies, skipping any larger
+        than ETAG_CACHE_MAX_BODY bytes.
+        """
+        cache_key = (url, tuple(sorted((params or {}).items())))
+        with self._etag_lock:
+            cached = self.etag_cache.get(cache_key)
+            if cached:
+                self.etag_cache.move_to_end(cache_key)
+
+        headers = {"If-None-Match": cached[0]} if cached else None
+        resp = self._request("GET", url, params=params, headers=headers)
+        if resp.status_code == 304 and cached:
+            return cached[1]
+
+        data = resp.json()
+        etag = resp.headers.get("ETag")
+        if etag and len(resp.content) <= ETAG_CACHE_MAX_BODY:
+            with self._etag_lock:
+                self.etag_cache[cache_key] = (etag, data)
+                self.etag_cache.move_to_end(cache_key)
+                while len(self.etag_cache) > ETAG_CACHE_MAXSIZE:
+                    self.etag_cache.popitem(last=False)
+        return data
+
+    def graphql(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Run a GraphQL query and return its `data` object.
+
+        Fields that fail to resolve (e.g. a missing commit) come back as
+        None in `data`; the request only raises if no data is returned.
+        Use graphql_with_errors to tell why a field is None.
+        """
+        return self.graphql_with_errors(query, variables)[0]
+
+    def graphql_with_errors(
+        self, query: str, variables: dict[str, Any] | None = None
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """Run a GraphQL query and return its `data` and partial `errors`.
+
+        Raises only if no data is returned; errors for individual fields
+        (each with a `path` and `type`) are passed back alongside the data.
+        """
+        if not self.token:
+            raise RuntimeError("GitHub GraphQL API requires a token (set GITHUB_TOKEN)")
+        resp = self._request("POST", self.GRAPHQL_URL, json={"query": query, "variables": variables or {}})
+        payload = resp.json()
+        if payload.get("data") is None:
+            raise RuntimeError(f"GraphQL query failed: {payload.get('errors')}")
+        return payload["data"], payload.get("errors") or []
+
+    def graphql_batch(self, keys: Sequence[GraphQLKey]) -> dict[GraphQLKey, dict[str, Any] | None]:
+        """Resolve many commits/issues/refs/releases with aliased GraphQL queries.
+
+        Keys are grouped by repository into one query per GRAPHQL_BATCH_SIZE
+        objects. The result maps each resolved key to its node, or None if
+        GitHub has no such object. Keys whose lookup failed for any other
+        reason (a failed request, or a field error such as FORBIDDEN or
+        RATE_LIMITED) are left out, so callers can fall back to the REST
+        methods.
+        """
+        unique = list(dict.fromkeys(keys))
+        results: dict[GraphQLKey, dict[str, Any] | None] = {}
+        for start in range(0, len(unique), GRAPHQL_BATCH_SIZE):
+            chunk = unique[start:start + GRAPHQL_BATCH_SIZE]
+            query, aliases = self._build_batch_query(chunk)
+            try:
+                data, errors = self.graphql_with_errors(query)
+            except Exception:
+                continue
+
+            # Error types by the (repository alias, field alias) prefix of their path;
+            # an error below the aliased field means its node is incomplete
+            error_types: dict[tuple[str, ...], set[str]] = {}
+            for error in errors:
+                path = tuple(str(p) for p in error.get("path") or ())
+                error_type = (error.get("type") or "") if len(path) <= 2 else "PARTIAL"
+                error_types.setdefault(path[:2], set()).add(error_type)
+            if error_types.get(()):
+                continue  # Errors not tied to a field may affect any key in the chunk
+
+            for key, (repo_alias, field_alias) in zip(chunk, aliases):
+                types = error_types.get((repo_alias,), set()) | error_types.get((repo_alias, field_alias), set())
+                if types - {"NOT_FOUND"}:
+                    continue
+                results[key] = None if types else (data.get(repo_alias) or {}).get(field_alias)
+        return results
+
+    @staticmethod
+    def _build_batch_query(keys: Sequence[GraphQLKey]) -> tuple[str, list[tuple[str, str]]]:
+        """Build one aliased query for keys, grouped by repository.
+
+        Returns the query and the (repository alias, field alias) pair for
+        each key, in input order.
+        """
+        repo_aliases: dict[tuple[str, str], str] = {}
+        repo_fields: dict[str, list[str]] = {}
+        aliases: list[tuple[str, str]] = []
+        used: set[str] = set()
+
+        for i, (owner, repo, kind, key) in enumerate(keys):
+            repo_alias = repo_aliases.setdefault((owner, repo), f"r{len(repo_aliases)}")
+            field_alias = f"o{i}"
+            # json.dumps yields valid GraphQL string literals
+            if kind == "commit":
+                field = f"object(oid: {json.dumps(key)}) {{ ...CommitFields }}"
+                used.add("CommitFields")
+            elif kind == "issue":
+                field = f"issueOrPullRequest(number: {int(key)}) {{ ...IssueFields ...PullRequestFields }}"
+                used.update(("IssueFields", "PullRequestFields"))
+            elif kind in ("branch", "tag"):
+                prefix = "refs/heads/" if kind == "branch" else "refs/tags/"
+                field = f"ref(qualifiedName: {json.dumps(prefix + key)}) {{ ...RefFields }}"
+                used.add("RefFields")
+            elif kind == "release":
+                field = f"release(tagName: {json.dumps(key)}) {{ tagName }}"
+            else:
+                raise ValueError(f"Unsupported GraphQL batch kind: {kind}")
+            repo_fields.setdefault(repo_alias, []).append(f"{field_alias}: {field}")
+            aliases.append((repo_alias, field_alias))
+
+        parts = [
+            f"{alias}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) {{ {' '.join(repo_fields[alias])} }}"
+            for (owner, repo), alias in repo_aliases.items()
+        ]
+        fragments = [_GRAPHQL_FRAGMENTS[name] for name in _GRAPHQL_FRAGMENTS if name in used]
+        return " ".join(["query { " + " ".join(parts) + " }", *fragments]), aliases
+
     def get_commit(self, owner: str, repo: str, sha: str) -> dict[str, Any]:
         """Fetch commit from GitHub API."""
-        session = self._get_session()
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/commits/{sha}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(url)
 
     def get_issue(self, owner: str, repo: str, number: int) -> dict[str, Any]:
         """Fetch issue from GitHub API."""
-        session = self._get_session()
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/issues/{number}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(url)
 
     def get_pull_request(self, owner: str, repo: str, number: int) -> dict[str, Any]:
         """Fetch PR from GitHub API."""
-        session = self._get_session()
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/pulls/{number}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(url)
 
     def get_file(self, owner: str, repo: str, path: str, ref: str = "HEAD") -> dict[str, Any]:
         """Fetch file content from GitHub API."""
-        session = self._get_session()
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/contents/{path}"
         params = {"ref": ref}
-        resp = session.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(url, params=params)
+
+    def get_file_raw(self, owner: str, repo: str, path: str, ref: str = "HEAD") -> Iterator[bytes]:
+        """Stream raw file bytes from GitHub API.
+
+        Uses the contents endpoint's raw media type, so no base64 JSON
+        envelope is built and files over the 1 MB JSON limit still work.
+        The request is sent before the first chunk is yielded; the response
+        is closed once the iterator is exhausted or discarded.
+        """
+        url = f"{self.BASE_URL}/repos/{owner}/{repo}/contents/{path}"
+        resp = self._request(
+            "GET", url, params={"ref": ref}, headers={"Accept": "application/vnd.github.raw"}, stream=True
+        )
+
+        def chunks() -> Iterator[bytes]:
+            with resp:
+                yield from resp.iter_content(chunk_size=RAW_CHUNK_SIZE)
+
+        return chunks()
 
     def get_branch(self, owner: str, repo: str, branch: str) -> dict[str, Any]:
         """Fetch branch from GitHub API."""
-        session = self._get_session()
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/branches/{branch}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(url)
 
     def get_tag(self, owner: str, repo: str, tag: str) -> dict[str, Any]:
         """Fetch tag from GitHub API."""
-        session = self._get_session()
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/git/refs/tags/{tag}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(url)
 
     def get_release(self, owner: str, repo: str, tag: str) -> dict[str, Any]:
         """Fetch release by tag from GitHub API."""
-        session = self._get_session()
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/releases/tags/{tag}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(url)
 
     def get_forks(self, owner: str, repo: str, per_page: int = 100) -> list[dict[str, Any]]:
         """Fetch forks from GitHub API."""
-        session = self._get_session()
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/forks"
         params = {"per_page": per_page}
-        resp = session.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(url, params=params)
 
     def get_repo(self, owner: str, repo: str) -> dict[str, Any]:
         """Fetch repository info from GitHub API."""
-        session = self._get_session()
         url = f"{self.BASE_URL}/repos/{owner}/{repo}"
-        resp = session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(url)
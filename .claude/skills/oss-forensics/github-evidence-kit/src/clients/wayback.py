@@ -5,6 +5,8 @@ from __future__ import annotations
 
 from typing import Any
 
+import requests
+
 from ..schema.common import EvidenceSource
 
 
@@ -24,8 +26,6 @@ class WaybackClient:
 
     def _get_session(self) -> Any:
         if self._session is None:
-            import requests
-
             self._session = requests.Session()
         return self._session
 
@@ -134,10 +134,10 @@ class GitHubAPICollector:
         data = self.client.get_file(owner, repo, path, ref)
         now = datetime.now(timezone.utc)
 
-        content = ""
-        if data.get("content"):
-            content = base64.b64decode(data["content"]).decode("utf-8", errors="replace")
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        raw_bytes = base64.b64decode(data["content"]) if data.get("content") else b""
+        content = raw_bytes.decode("utf-8", errors="replace")
+        # Hash the raw bytes, not the decoded text, so binary files hash stably
+        content_hash = hashlib.sha256(raw_bytes).hexdigest()
 
         return FileObservation(
             evidence_id=generate_evidence_id("file", f"{owner}/{repo}", path, ref),
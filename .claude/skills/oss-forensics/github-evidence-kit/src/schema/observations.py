@@ -101,7 +101,7 @@ class FileObservation(Observation):
     file_path: str
     branch: str | None = None
     content: str = ""  # File content (may be empty for large files)
-    content_hash: str | None = None  # SHA256
+    content_hash: str | None = None  # SHA256 of the raw file bytes
     size_bytes: int = 0
 
 
@@ -140,16 +140,15 @@ class EvidenceStore:
         path.write_text(self.to_json())
 
     @classmethod
-    def from_json(cls, json_str: str) -> "EvidenceStore":
+    def from_json(cls, json_str: str | bytes) -> "EvidenceStore":
         """Create store from JSON string."""
-        from . import load_evidence_from_json
-        data = json.loads(json_str)
-        return cls([load_evidence_from_json(item) for item in data])
+        from . import load_evidence_batch_from_json_bytes
+        return cls(load_evidence_batch_from_json_bytes(json_str))
 
     @classmethod
     def load(cls, path: str | Path) -> "EvidenceStore":
         """Load store from JSON file."""
-        return cls.from_json(Path(path).read_text())
+        return cls.from_json(Path(path).read_bytes())
 
     def merge(self, other: "EvidenceStore") -> None:
         """Merge another store into this one."""
@@ -6,7 +6,9 @@ Tests the extracted client classes. These are mostly structural tests
 since the actual API calls require network access (covered in integration tests).
 """
 
+import json
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -15,7 +17,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.clients.gharchive import GHArchiveClient
 from src.clients.git import GitClient
-from src.clients.github import GitHubClient
+from src.clients import github
+from src.clients.github import GitHubClient, RateLimiter
 from src.clients.wayback import WaybackClient
 from src.schema.common import EvidenceSource
 
@@ -55,6 +58,291 @@ class TestGitHubClient:
         assert hasattr(client, "get_release")
         assert hasattr(client, "get_forks")
         assert hasattr(client, "get_repo")
+        assert hasattr(client, "graphql")
+        assert hasattr(client, "graphql_batch")
+
+    def test_batch_query_groups_by_repo_with_used_fragments(self):
+        """Keys share one repository block and only referenced fragments are sent."""
+        query, aliases = GitHubClient._build_batch_query([
+            ("o", "r", "commit", "a" * 40),
+            ("o", "r", "release", "v1"),
+            ("o", "other", "issue", 7),
+        ])
+        assert aliases == [("r0", "o0"), ("r0", "o1"), ("r1", "o2")]
+        assert query.count("repository(") == 2
+        assert "fragment CommitFields" in query and "fragment IssueFields" in query
+        assert "fragment RefFields" not in query
+
+    def test_graphql_batch_dedupes_and_maps_nodes(self):
+        """Duplicate keys are queried once; missing nodes map to None."""
+        client = GitHubClient(token="t")
+        queries = []
+
+        def fake_graphql(query, variables=None):
+            queries.append(query)
+            return {"r0": {"o0": {"oid": "a" * 40}, "o1": None}}, []
+
+        client.graphql_with_errors = fake_graphql
+        commit, branch = ("o", "r", "commit", "a" * 40), ("o", "r", "branch", "gone")
+
+        assert client.graphql_batch([commit, branch, commit]) == {commit: {"oid": "a" * 40}, branch: None}
+        assert len(queries) == 1
+
+    def test_graphql_batch_only_treats_not_found_as_missing(self):
+        """Null fields from FORBIDDEN or RATE_LIMITED errors are left for REST."""
+        client = GitHubClient(token="t")
+        data = {"r0": {"o0": None, "o1": None, "o2": {"oid": "c" * 40, "author": None}, "o3": None}}
+        errors = [
+            {"type": "NOT_FOUND", "path": ["r0", "o0"]},
+            {"type": "FORBIDDEN", "path": ["r0", "o1"]},
+            {"type": "RATE_LIMITED", "path": ["r0", "o2", "author"]},
+        ]
+        client.graphql_with_errors = lambda query, variables=None: (data, errors)
+        gone, forbidden, partial, missing = (("o", "r", "commit", c * 40) for c in "abcd")
+
+        assert client.graphql_batch([gone, forbidden, partial, missing]) == {gone: None, missing: None}
+
+    def test_graphql_batch_skips_chunk_on_pathless_error(self):
+        """An error without a path may concern any key, so the chunk falls back."""
+        client = GitHubClient(token="t")
+        client.graphql_with_errors = lambda query, variables=None: (
+            {"r0": {"o0": None}}, [{"type": "TIMEOUT", "message": "timed out"}]
+        )
+        assert client.graphql_batch([("o", "r", "commit", "a" * 40)]) == {}
+
+
+class FakeResponse:
+    """Minimal response carrying a status code and headers."""
+
+    def __init__(self, status_code=200, headers=None, json_data=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.json_data = json_data
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    @property
+    def content(self):
+        return b"" if self.json_data is None else json.dumps(self.json_data).encode()
+
+    def json(self):
+        if self.json_data is None:
+            raise ValueError("No JSON body")
+        return self.json_data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"{self.status_code} Error")
+
+
+class FakeClock:
+    """Deterministic clock whose sleep() advances time."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Test header-driven request pacing."""
+
+    def test_no_wait_with_plenty_of_quota(self):
+        """Requests are not delayed while quota is comfortable."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock.time, sleep=clock.sleep)
+        limiter.update(FakeResponse(headers={"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "4600"}))
+        limiter.acquire()
+        assert clock.sleeps == []
+
+    def test_spreads_low_quota_until_reset(self):
+        """Low remaining quota is spread evenly over the time to reset."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock.time, sleep=clock.sleep)
+        limiter.update(FakeResponse(headers={"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1100"}))
+        limiter.acquire()
+        limiter.acquire()
+        assert clock.sleeps == [10.0]
+
+    def test_pacing_is_shared_across_threads(self):
+        """Concurrent callers reserve distinct slots instead of waking together."""
+        clock = FakeClock()
+        sleeps = []
+        # Time stands still, so every thread sees the same now and interval
+        limiter = RateLimiter(clock=clock.time, sleep=sleeps.append)
+        limiter.update(FakeResponse(headers={"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1100"}))
+
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(sleeps) == [10.0 * i for i in range(1, 8)]
+
+    def test_unauthenticated_quota_is_not_paced_early(self):
+        """30 requests against the 60/hour quota go out without waiting."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock.time, sleep=clock.sleep)
+        for remaining in range(59, 29, -1):
+            limiter.acquire()
+            limiter.update(FakeResponse(headers={
+                "X-RateLimit-Limit": "60", "X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": "4600",
+            }))
+        assert clock.sleeps == []
+
+    def test_buckets_are_tracked_per_resource(self):
+        """A nearly spent GraphQL bucket does not slow REST calls."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock.time, sleep=clock.sleep)
+        limiter.update(FakeResponse(headers={
+            "X-RateLimit-Resource": "graphql", "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "4000",
+        }), "graphql")
+        limiter.update(FakeResponse(headers={
+            "X-RateLimit-Resource": "core", "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "4600",
+        }))
+        limiter.acquire("core")
+        limiter.acquire("core")
+        assert clock.sleeps == []
+        limiter.acquire("graphql")
+        limiter.acquire("graphql")
+        assert clock.sleeps == [600.0]
+
+    def test_retry_after_pauses_and_requests_retry(self):
+        """A throttled 403 with Retry-After pauses callers and asks for a retry."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock.time, sleep=clock.sleep)
+        assert limiter.update(FakeResponse(403, {"Retry-After": "30"}))
+        limiter.acquire()
+        assert clock.sleeps == [30.0]
+
+    def test_plain_403_is_not_retried(self):
+        """A 403 unrelated to rate limiting is passed through."""
+        limiter = RateLimiter()
+        assert not limiter.update(FakeResponse(403, {"X-RateLimit-Remaining": "59"}))
+
+    def test_client_retries_throttled_request_once(self):
+        """GitHubClient waits out Retry-After, closes the throttled reply, then resends."""
+        clock = FakeClock()
+        throttled = FakeResponse(403, {"Retry-After": "5"})
+        responses = [throttled, FakeResponse(200)]
+
+        class FakeSession:
+            def request(self, method, url, **kwargs):
+                return responses.pop(0)
+
+        client = GitHubClient(token="")
+        client._session = FakeSession()
+        client.rate_limiter = RateLimiter(clock=clock.time, sleep=clock.sleep)
+
+        assert client._request("GET", "https://api.github.com/x").status_code == 200
+        assert clock.sleeps == [5.0]
+        assert throttled.closed
+
+    def test_session_leaves_429_to_the_limiter(self):
+        """urllib3 does not retry 429s, so every throttled reply reaches update()."""
+        adapter = GitHubClient(token="")._get_session().get_adapter("https://api.github.com")
+        assert 429 not in adapter.max_retries.status_forcelist
+
+
+class TestConditionalRequests:
+    """Test ETag revalidation in GitHubClient REST getters."""
+
+    def test_not_modified_returns_cached_body(self):
+        """A repeat fetch sends If-None-Match and reuses the body on 304."""
+        responses = [
+            FakeResponse(200, {"ETag": '"abc"'}, {"sha": "a" * 40}),
+            FakeResponse(304, {"ETag": '"abc"'}),
+        ]
+        sent_headers = []
+
+        class FakeSession:
+            def request(self, method, url, **kwargs):
+                sent_headers.append(kwargs.get("headers"))
+                return responses.pop(0)
+
+        client = GitHubClient(token="")
+        client._session = FakeSession()
+
+        first = client.get_commit("o", "r", "a" * 40)
+        second = client.get_commit("o", "r", "a" * 40)
+
+        assert first == second == {"sha": "a" * 40}
+        assert sent_headers == [None, {"If-None-Match": '"abc"'}]
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """Past ETAG_CACHE_MAXSIZE entries, the least recently used is dropped."""
+        monkeypatch.setattr(github, "ETAG_CACHE_MAXSIZE", 2)
+
+        class FakeSession:
+            def request(self, method, url, **kwargs):
+                if kwargs.get("headers"):
+                    return FakeResponse(304)
+                return FakeResponse(200, {"ETag": f'"{url}"'}, {"url": url})
+
+        client = GitHubClient(token="")
+        client._session = FakeSession()
+
+        client.get_repo("o", "a")
+        client.get_repo("o", "b")
+        client.get_repo("o", "a")  # Revalidated, so now most recently used
+        client.get_repo("o", "c")
+
+        assert [key[0].rsplit("/", 1)[1] for key in client.etag_cache] == ["a", "c"]
+
+    def test_large_bodies_are_not_cached(self, monkeypatch):
+        """Bodies over ETAG_CACHE_MAX_BODY bytes are refetched rather than kept."""
+        monkeypatch.setattr(github, "ETAG_CACHE_MAX_BODY", 10)
+
+        class FakeSession:
+            def request(self, method, url, **kwargs):
+                return FakeResponse(200, {"ETag": '"big"'}, {"content": "x" * 100})
+
+        client = GitHubClient(token="")
+        client._session = FakeSession()
+
+        client.get_file("o", "r", "big.bin")
+        assert client.etag_cache == {}
+
+    def test_file_raw_streams_with_raw_media_type(self):
+        """Raw file fetches ask for the raw media type and stream chunks."""
+        sent = []
+
+        class RawResponse(FakeResponse):
+            closed = False
+
+            def iter_content(self, chunk_size):
+                yield b"ab"
+                yield b"cd"
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                RawResponse.closed = True
+
+        class FakeSession:
+            def request(self, method, url, **kwargs):
+                sent.append(kwargs)
+                return RawResponse()
+
+        client = GitHubClient(token="")
+        client._session = FakeSession()
+
+        assert b"".join(client.get_file_raw("o", "r", "a.bin")) == b"abcd"
+        assert sent[0]["headers"] == {"Accept": "application/vnd.github.raw"}
+        assert sent[0]["stream"] is True
+        assert RawResponse.closed
 
 
 # =============================================================================
@@ -109,6 +397,79 @@ class TestGHArchiveClient:
         client = GHArchiveClient()
         assert hasattr(client, "query_events")
 
+    def test_credential_check_does_not_build_client(self):
+        """has_credentials() resolves credentials once without creating BigQuery."""
+        client = GHArchiveClient()
+        calls = []
+        client._resolve_credentials = lambda: calls.append(1) or (object(), "p")
+
+        assert client.has_credentials()
+        assert client.has_credentials()
+        assert calls == [1]
+        assert client._client is None
+
+    def test_credentials_without_project_are_unavailable(self):
+        """Resolved credentials with no project report unavailable unless project_id is set."""
+        no_project = GHArchiveClient()
+        no_project._resolve_credentials = lambda: (object(), None)
+        assert not no_project.has_credentials()
+
+        explicit = GHArchiveClient(project_id="my-project")
+        explicit._resolve_credentials = lambda: (object(), None)
+        assert explicit.has_credentials()
+
+    def test_event_exists_limits_scan(self):
+        """Existence checks select one constant row under a billing cap."""
+        sent = []
+
+        class FakeBigQuery:
+            def query(self, query, job_config=None):
+                sent.append((query, job_config))
+                return iter([{"f0_": 1}])
+
+        client = GHArchiveClient()
+        client._client = FakeBigQuery()
+
+        assert client.event_exists(repo="o/r", actor="u", minute="202507132037")
+        query, job_config = sent[0]
+        assert "SELECT 1" in query and "LIMIT 1" in query and "githubarchive.day.20250713" in query
+        assert job_config.maximum_bytes_billed == 10 * 1024**3
+        assert {p.name for p in job_config.query_parameters} == {"start", "end", "repo", "actor"}
+
+    def test_event_exists_rejects_bad_minute(self):
+        """Malformed minute keys are rejected before a query is built."""
+        with pytest.raises(ValueError, match="Invalid date format"):
+            GHArchiveClient().event_exists(minute="2025071")
+
+    def test_batch_matches_exact_keys(self):
+        """Batch lookups send one joined key per filter and map matches back."""
+        sent = []
+
+        class FakeBigQuery:
+            def query(self, query, job_config=None):
+                sent.append(job_config)
+                return iter([{"event_key": "o/r|u|202507132037"}])
+
+        client = GHArchiveClient()
+        client._client = FakeBigQuery()
+
+        found = client.query_events_batch([("o/r", "u", "202507132037"), ("o/r", "v", "202507132040")])
+
+        assert found == {("o/r", "u", "202507132037")}
+        (keys,) = sent[0].query_parameters
+        assert keys.values == ["o/r|u|202507132037", "o/r|v|202507132040"]
+        assert sent[0].maximum_bytes_billed == 10 * 1024**3
+
+    def test_batch_rejects_mixed_days(self):
+        """Batch filters spanning several daily tables are rejected before querying."""
+        client = GHArchiveClient()
+        with pytest.raises(ValueError, match="share one day"):
+            client.query_events_batch([
+                ("aws/aws-toolkit-vscode", "a", "202507132037"),
+                ("aws/aws-toolkit-vscode", "a", "202507140800"),
+            ])
+        assert client._client is None
+
 
 # =============================================================================
 # GIT CLIENT TESTS
@@ -16,7 +16,14 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src import EvidenceStore, EvidenceSource, load_evidence_from_json
+from src import (
+    EvidenceStore,
+    EvidenceSource,
+    load_evidence_batch,
+    load_evidence_batch_from_json_bytes,
+    load_evidence_from_json,
+    load_evidence_from_json_bytes,
+)
 
 
 # =============================================================================
@@ -268,6 +275,83 @@ class TestEvidenceStoreSerialization:
             assert filepath.exists()
 
 
+# =============================================================================
+# EVIDENCE LOADING
+# =============================================================================
+
+
+class TestEvidenceLoading:
+    """Test JSON evidence loaders."""
+
+    def test_union_members_fully_built_at_import(self):
+        """No member defers schema build, so the first load pays no rebuild cost."""
+        import src
+
+        for model in src._EVENT_TYPES + src._OBSERVATION_TYPES:
+            assert model.__pydantic_complete__, model.__name__
+
+    def test_load_unknown_type_raises(self, sample_push_event_data):
+        """Unknown discriminator value raises ValueError."""
+        sample_push_event_data["event_type"] = "not_a_real_event"
+        with pytest.raises(ValueError):
+            load_evidence_from_json(sample_push_event_data)
+
+    def test_load_accepts_model_instances(self, sample_commit_observation_data):
+        """Already-built models pass through the tagged unions unchanged."""
+        commit = load_evidence_from_json(sample_commit_observation_data)
+        assert load_evidence_from_json(commit) is commit
+
+    def test_load_missing_type_raises(self):
+        """Data without event_type or observation_type raises ValueError."""
+        with pytest.raises(ValueError, match="event_type.*observation_type"):
+            load_evidence_from_json({"evidence_id": "x"})
+
+    def test_load_batch_preserves_order(self, sample_push_event_data, sample_commit_observation_data, sample_ioc_data):
+        """Batch loading returns items in input order."""
+        items = [sample_commit_observation_data, sample_push_event_data, sample_ioc_data]
+        loaded = load_evidence_batch(items)
+
+        assert [e.evidence_id for e in loaded] == ["commit-test-001", "push-test-001", "ioc-test-001"]
+        assert loaded[1].event_type == "push"
+
+    def test_load_batch_rejects_untyped_item(self, sample_push_event_data):
+        """Batch loading raises on items without a type field."""
+        with pytest.raises(ValueError, match="event_type.*observation_type"):
+            load_evidence_batch([sample_push_event_data, {"evidence_id": "x"}])
+
+    def test_load_from_json_bytes(self, sample_push_event_data, sample_ioc_data):
+        """Raw JSON bytes load into the matching evidence type."""
+        event = load_evidence_from_json_bytes(json.dumps(sample_push_event_data).encode())
+        ioc = load_evidence_from_json_bytes(json.dumps(sample_ioc_data))
+
+        assert event.event_type == "push"
+        assert ioc.observation_type == "ioc"
+
+    def test_load_batch_from_json_bytes(self, sample_push_event_data, sample_commit_observation_data):
+        """A mixed JSON array loads in one call."""
+        raw = json.dumps([sample_push_event_data, sample_commit_observation_data]).encode()
+        loaded = load_evidence_batch_from_json_bytes(raw)
+
+        assert [e.evidence_id for e in loaded] == ["push-test-001", "commit-test-001"]
+
+    def test_json_loaders_skip_callable_discriminator(self, monkeypatch, sample_push_event_data, sample_ioc_data):
+        """Raw JSON goes to the string-discriminated adapters, not EVIDENCE_ADAPTER."""
+        import src
+
+        class Unused:
+            def validate_json(self, raw):
+                raise AssertionError("EVIDENCE_ADAPTER used for typed JSON")
+
+        monkeypatch.setattr(src, "EVIDENCE_ADAPTER", Unused())
+        assert load_evidence_from_json_bytes(json.dumps(sample_push_event_data).encode()).event_type == "push"
+        assert load_evidence_from_json_bytes(json.dumps(sample_ioc_data)).observation_type == "ioc"
+
+        # The array adapter dispatches on string tags only: a plain union of the two families
+        union = src._EVIDENCE_JSON_LIST_ADAPTER.core_schema["schema"]["items_schema"]
+        assert union["type"] == "union"
+        assert [choice["discriminator"] for choice in union["choices"]] == ["event_type", "observation_type"]
+
+
 # =============================================================================
 # STORE MERGE AND SUMMARY
 # =============================================================================
@@ -0,0 +1,803 @@
+#!/usr/bin/env python3
+"""
+Unit tests for verifiers/consistency.py.
+
+Uses fake clients so no network access is needed; live verification is
+covered by the integration tests.
+"""
+
+import asyncio
+import hashlib
+import io
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from google.auth.exceptions import DefaultCredentialsError
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import load_evidence_from_json
+from src.verifiers import consistency
+from src.clients.gharchive import GHArchiveClient
+from src.clients.github import GitHubClient
+from src.verifiers.consistency import ConsistencyVerifier
+
+
+# =============================================================================
+# FAKE CLIENTS
+# =============================================================================
+
+
+class FakeGitHubClient:
+    """Records calls and returns canned GitHub responses."""
+
+    def __init__(self, token=None, graphql_data=None, graphql_errors=None, commits=None, files=None):
+        self.token = token
+        self.graphql_data = graphql_data or {}
+        self.graphql_errors = graphql_errors or []
+        self.commits = commits or {}
+        self.files = files or {}
+        self.graphql_calls: list[str] = []
+        self.rest_calls: list[tuple] = []
+
+    # Real query building and alias mapping over the canned graphql_with_errors() below
+    graphql_batch = GitHubClient.graphql_batch
+    _build_batch_query = staticmethod(GitHubClient._build_batch_query)
+
+    def graphql_with_errors(self, query, variables=None):
+        self.graphql_calls.append(query)
+        return self.graphql_data, self.graphql_errors
+
+    def get_commit(self, owner, repo, sha):
+        self.rest_calls.append(("commit", owner, repo, sha))
+        return self.commits[sha]
+
+    def get_file(self, owner, repo, path, ref="HEAD"):
+        self.rest_calls.append(("file", owner, repo, path, ref))
+        return self.files[path]
+
+    def get_file_raw(self, owner, repo, path, ref="HEAD"):
+        self.rest_calls.append(("file_raw", owner, repo, path, ref))
+        raw = self.files[path]
+        return iter([raw[i:i + 4] for i in range(0, len(raw), 4)])
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, text="", status_code=200, json_data=None):
+        self.text = text
+        self.status_code = status_code
+        self.json_data = json_data
+        self.encoding = "utf-8"
+        self.chunks_read = 0
+
+    def iter_content(self, chunk_size=1):
+        raw = self.text.encode(self.encoding)
+        for start in range(0, len(raw), chunk_size):
+            self.chunks_read += 1
+            yield raw[start:start + chunk_size]
+
+    def json(self):
+        return self.json_data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise consistency.requests.HTTPError(f"{self.status_code} Error")
+
+
+class FakeSession:
+    """Serves canned responses by URL and records requests."""
+
+    def __init__(self, pages, head_status=None):
+        self.pages = pages
+        self.head_status = head_status
+        self.calls: list[tuple[str, str]] = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(("GET", url))
+        return self.pages[url]
+
+    def head(self, url, **kwargs):
+        self.calls.append(("HEAD", url))
+        if self.head_status is not None:
+            return FakeResponse(status_code=self.head_status)
+        return FakeResponse(status_code=self.pages[url].status_code)
+
+
+class FakeGHArchiveClient:
+    """Answers batch queries from a fixed set of matching keys."""
+
+    def __init__(self, existing=(), credentials=True):
+        self.existing = set(existing)
+        self.credentials = credentials
+        self.batch_calls: list[list[tuple]] = []
+        self.credential_probes = 0
+        self.project_id = None
+        self._credentials = None
+        self._credentials_available = None
+        self._credentials_lock = threading.Lock()
+
+    # Real once-only probe over the counting _resolve_credentials() below
+    has_credentials = GHArchiveClient.has_credentials
+
+    def _resolve_credentials(self):
+        self.credential_probes += 1
+        if not self.credentials:
+            raise DefaultCredentialsError("no credentials")
+        return object(), "project"
+
+    def event_exists(self, repo=None, actor=None, minute=""):
+        return (repo, actor, minute) in self.existing
+
+    def query_events_batch(self, filters):
+        self.batch_calls.append(list(filters))
+        return self.existing & set(filters)
+
+
+@pytest.fixture(autouse=True)
+def clear_page_cache():
+    """Source pages are cached per process; isolate each test."""
+    consistency._PAGE_SCANS.clear()
+    yield
+    consistency._PAGE_SCANS.clear()
+
+
+@pytest.fixture
+def commit_obs(sample_commit_observation_data):
+    return load_evidence_from_json(sample_commit_observation_data)
+
+
+def _commit_payload(obs):
+    return {
+        "sha": obs.sha,
+        "commit": {"message": obs.message, "author": {"name": obs.author.name}},
+    }
+
+
+# =============================================================================
+# GRAPHQL BATCH VERIFICATION
+# =============================================================================
+
+
+class TestGraphQLBatch:
+    """Test batched GitHub verification in verify_all."""
+
+    def test_without_token_falls_back_to_rest(self, commit_obs):
+        """No token: commits are verified one REST call at a time."""
+        client = FakeGitHubClient(commits={commit_obs.sha: _commit_payload(commit_obs)})
+        verifier = ConsistencyVerifier(github_client=client)
+
+        result = verifier.verify_all([commit_obs])
+
+        assert result.is_valid
+        assert client.graphql_calls == []
+        assert len(client.rest_calls) == 1
+
+    def test_batch_resolves_commits_in_one_query(self, sample_commit_observation_data):
+        """Several commits are resolved by a single GraphQL request."""
+        obs1 = load_evidence_from_json(sample_commit_observation_data)
+        sample_commit_observation_data["evidence_id"] = "commit-test-002"
+        sample_commit_observation_data["sha"] = "b" * 40
+        obs2 = load_evidence_from_json(sample_commit_observation_data)
+
+        node = {"message": obs1.message, "author": {"name": obs1.author.name}}
+        client = FakeGitHubClient(
+            token="t",
+            graphql_data={"r0": {"o0": {"oid": obs1.sha, **node}, "o1": {"oid": obs2.sha, **node}}},
+        )
+        verifier = ConsistencyVerifier(github_client=client)
+
+        result = verifier.verify_all([obs1, obs2])
+
+        assert result.is_valid
+        assert len(client.graphql_calls) == 1
+        assert client.rest_calls == []
+
+    def test_batch_reports_mismatch(self, commit_obs):
+        """Mismatched fields are reported with the evidence ID."""
+        client = FakeGitHubClient(
+            token="t",
+            graphql_data={"r0": {"o0": {"oid": commit_obs.sha, "message": "other", "author": {"name": "x"}}}},
+        )
+        verifier = ConsistencyVerifier(github_client=client)
+
+        result = verifier.verify_all([commit_obs])
+
+        assert not result.is_valid
+        assert "[commit-test-001] Message mismatch" in result.errors
+        assert any("Author mismatch" in e for e in result.errors)
+
+    def test_batch_missing_node(self, commit_obs):
+        """A missing GraphQL node fails the observation."""
+        client = FakeGitHubClient(token="t", graphql_data={"r0": {"o0": None}})
+        verifier = ConsistencyVerifier(github_client=client)
+
+        assert not verifier.verify_all([commit_obs]).is_valid
+
+    def test_batch_forbidden_node_falls_back_to_rest(self, commit_obs):
+        """A node nulled by a FORBIDDEN error is re-checked over REST, not failed."""
+        client = FakeGitHubClient(
+            token="t",
+            graphql_data={"r0": {"o0": None}},
+            graphql_errors=[{"type": "FORBIDDEN", "path": ["r0", "o0"]}],
+            commits={commit_obs.sha: _commit_payload(commit_obs)},
+        )
+        verifier = ConsistencyVerifier(github_client=client)
+
+        assert verifier.verify_all([commit_obs]).is_valid
+        assert len(client.graphql_calls) == 1
+        assert [call[0] for call in client.rest_calls] == ["commit"]
+
+    def test_deleted_observation_skips_network(self, commit_obs):
+        """Observations marked deleted pass without any GitHub lookup."""
+        client = FakeGitHubClient(token="t")
+        verifier = ConsistencyVerifier(github_client=client)
+        deleted = commit_obs.model_copy(update={"is_deleted": True})
+
+        assert verifier.verify_all([deleted]).is_valid
+        assert verifier.verify(deleted).is_valid
+        assert client.graphql_calls == [] and client.rest_calls == []
+
+    def test_batch_covers_tags_and_releases(self, sample_commit_observation_data):
+        """Tags and releases share the GraphQL query with commits."""
+        base = {
+            k: sample_commit_observation_data[k]
+            for k in ("observed_when", "observed_by", "observed_what", "repository", "verification")
+        }
+        tag = load_evidence_from_json(
+            {**base, "observation_type": "tag", "evidence_id": "tag-1", "tag_name": "v1", "target_sha": "c" * 40}
+        )
+        release = load_evidence_from_json(
+            {**base, "observation_type": "release", "evidence_id": "rel-1", "tag_name": "v1"}
+        )
+        client = FakeGitHubClient(
+            token="t",
+            graphql_data={"r0": {"o0": {"target": {"oid": "d" * 40}}, "o1": {"tagName": "v1"}}},
+        )
+
+        result = ConsistencyVerifier(github_client=client).verify_all([tag, release])
+
+        assert len(client.graphql_calls) == 1
+        assert "fragment RefFields on Ref" in client.graphql_calls[0]
+        assert result.errors == [f"[tag-1] Target SHA mismatch: expected {'c' * 40}, got {'d' * 40}"]
+
+
+# =============================================================================
+# RESULT MEMOIZATION
+# =============================================================================
+
+
+class TestResultMemoization:
+    """Test reuse of sub-verifier results for repeated entities."""
+
+    def test_duplicate_commit_fetched_once(self, commit_obs):
+        """Distinct observations of the same commit share one REST call."""
+        client = FakeGitHubClient(commits={commit_obs.sha: _commit_payload(commit_obs)})
+        verifier = ConsistencyVerifier(github_client=client)
+        copy = commit_obs.model_copy(update={"evidence_id": "commit-test-002"})
+
+        assert verifier.verify_all([commit_obs, copy]).is_valid
+        assert len(client.rest_calls) == 1
+
+    def test_compared_fields_are_part_of_key(self, commit_obs):
+        """An observation with a different message is verified afresh."""
+        client = FakeGitHubClient(commits={commit_obs.sha: _commit_payload(commit_obs)})
+        verifier = ConsistencyVerifier(github_client=client)
+        altered = commit_obs.model_copy(update={"message": "something else"})
+
+        assert verifier.verify(commit_obs).is_valid
+        assert not verifier.verify(altered).is_valid
+        assert len(client.rest_calls) == 2
+
+    def test_ttl_cache_expires_and_evicts(self):
+        """Entries expire after the TTL and the oldest is evicted past maxsize."""
+        now = [0.0]
+        cache = consistency._TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        now[0] = 11
+        assert cache.get("c") is None
+
+
+# =============================================================================
+# FILE VERIFICATION
+# =============================================================================
+
+
+class TestFileVerification:
+    """Test file content hash verification."""
+
+    def _file_obs(self, content_hash):
+        return load_evidence_from_json({
+            "observation_type": "file",
+            "evidence_id": "file-test-001",
+            "observed_when": "2025-11-28T21:00:00Z",
+            "observed_by": "github",
+            "observed_what": "File observed via GitHub API",
+            "repository": {"owner": "aws", "name": "aws-toolkit-vscode", "full_name": "aws/aws-toolkit-vscode"},
+            "verification": {"source": "github", "url": "https://github.com/aws/aws-toolkit-vscode/blob/HEAD/a.bin"},
+            "file_path": "a.bin",
+            "content_hash": content_hash,
+        })
+
+    def test_hash_is_over_raw_bytes(self):
+        """Binary content that is not valid UTF-8 hashes stably across chunks."""
+        raw = b"\xff\xfe\x00binary"
+        client = FakeGitHubClient(files={"a.bin": raw})
+        verifier = ConsistencyVerifier(github_client=client)
+
+        assert verifier.verify(self._file_obs(hashlib.sha256(raw).hexdigest())).is_valid
+        assert not verifier.verify(self._file_obs("0" * 64)).is_valid
+        assert {call[0] for call in client.rest_calls} == {"file_raw"}
+
+    def test_without_hash_only_checks_existence(self):
+        """No content hash: file metadata is fetched, raw content is not."""
+        client = FakeGitHubClient(files={"a.bin": {"content": ""}})
+
+        assert ConsistencyVerifier(github_client=client).verify(self._file_obs(None)).is_valid
+        assert [call[0] for call in client.rest_calls] == ["file"]
+
+
+# =============================================================================
+# CONCURRENT VERIFICATION
+# =============================================================================
+
+
+class TestConcurrentVerifyAll:
+    """Test thread-pooled verification of non-GitHub evidence."""
+
+    def test_errors_keep_input_order(self, monkeypatch, sample_ioc_data):
+        """Aggregated errors follow input order regardless of completion order."""
+        items = []
+        pages = {}
+        for i in range(8):
+            sample_ioc_data["evidence_id"] = f"ioc-{i}"
+            sample_ioc_data["verification"]["url"] = f"https://example.com/report{i}"
+            items.append(load_evidence_from_json(sample_ioc_data))
+            pages[f"https://example.com/report{i}"] = FakeResponse(text="unrelated")
+        monkeypatch.setattr(consistency, "_SESSION", FakeSession(pages))
+
+        result = ConsistencyVerifier(github_client=FakeGitHubClient()).verify_all(items, max_workers=4)
+
+        assert not result.is_valid
+        assert [e.split("]")[0] for e in result.errors] == [f"[ioc-{i}" for i in range(8)]
+
+    def test_verify_many_parallelises_github_lookups(self, sample_commit_observation_data):
+        """GitHub REST lookups overlap under verify_many; results keep input order."""
+        observations = []
+        for i in range(4):
+            sample_commit_observation_data["evidence_id"] = f"commit-{i}"
+            sample_commit_observation_data["sha"] = str(i) * 40
+            observations.append(load_evidence_from_json(sample_commit_observation_data))
+
+        barrier = threading.Barrier(len(observations), timeout=5)
+
+        class ConcurrentClient(FakeGitHubClient):
+            def get_commit(self, owner, repo, sha):
+                barrier.wait()
+                return super().get_commit(owner, repo, sha)
+
+        client = ConcurrentClient(commits={o.sha: _commit_payload(o) for o in observations})
+        results = ConsistencyVerifier(github_client=client).verify_many(observations, max_workers=4)
+
+        assert [r.is_valid for r in results] == [True] * 4
+        assert sorted(call[3] for call in client.rest_calls) == [o.sha for o in observations]
+
+    def test_averify_many_runs_concurrently_in_order(self, monkeypatch, sample_ioc_data):
+        """Async verification overlaps items and returns one result per input, in order."""
+        items = []
+        for i in range(4):
+            sample_ioc_data["evidence_id"] = f"ioc-{i}"
+            items.append(load_evidence_from_json(sample_ioc_data))
+
+        # Every call waits for all four to be in flight, so serial execution would time out
+        barrier = threading.Barrier(len(items), timeout=5)
+        verifier = ConsistencyVerifier(github_client=FakeGitHubClient())
+
+        def fake_verify(evidence):
+            barrier.wait()
+            return consistency.VerificationResult(is_valid=False, errors=[evidence.evidence_id])
+
+        monkeypatch.setattr(verifier, "verify", fake_verify)
+
+        results = asyncio.run(verifier.averify_many(items, concurrency=4))
+
+        assert [r.errors for r in results] == [[f"ioc-{i}"] for i in range(4)]
+
+    def test_averify_many_cancellation_does_not_block(self, sample_ioc_data):
+        """Cancelling averify_many returns promptly and drops queued items."""
+        items = []
+        for i in range(4):
+            sample_ioc_data["evidence_id"] = f"ioc-{i}"
+            items.append(load_evidence_from_json(sample_ioc_data))
+
+        release = threading.Event()
+        started = []
+        verifier = ConsistencyVerifier(github_client=FakeGitHubClient())
+
+        def slow_verify(evidence):
+            started.append(evidence.evidence_id)
+            release.wait(timeout=5)
+            return consistency.VerificationResult(is_valid=True, errors=[])
+
+        verifier.verify = slow_verify
+
+        async def run():
+            task = asyncio.create_task(verifier.averify_many(items, concurrency=1))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(asyncio.wait_for(run(), timeout=2))
+        release.set()
+
+        assert started == ["ioc-0"]
+
+    def test_default_concurrency_fits_connection_pool(self):
+        """Default worker counts never exceed the GitHub session pool."""
+        assert consistency._DEFAULT_ASYNC_CONCURRENCY <= consistency.SESSION_POOL_SIZE
+        assert consistency._DEFAULT_VERIFY_MANY_WORKERS <= consistency.SESSION_POOL_SIZE
+
+
+# =============================================================================
+# EVENT DISPATCH
+# =============================================================================
+
+
+class TestEventDispatch:
+    """Test source-based dispatch of events."""
+
+    def test_local_git_event_not_supported(self, sample_push_event_data):
+        """Git-sourced events pass with an explanatory note."""
+        sample_push_event_data["verification"] = {"source": "git"}
+        event = load_evidence_from_json(sample_push_event_data)
+
+        result = ConsistencyVerifier(github_client=FakeGitHubClient()).verify(event)
+
+        assert result.is_valid
+        assert result.errors == ["Local git verification not supported"]
+
+    def test_unknown_event_source(self, sample_push_event_data):
+        """Events from a source with no event verifier fail."""
+        sample_push_event_data["verification"] = {"source": "wayback"}
+        event = load_evidence_from_json(sample_push_event_data)
+
+        result = ConsistencyVerifier(github_client=FakeGitHubClient()).verify(event)
+
+        assert not result.is_valid
+        assert "Unknown verification source for event" in result.errors[0]
+
+
+# =============================================================================
+# GH ARCHIVE BATCH VERIFICATION
+# =============================================================================
+
+
+class TestGHArchiveBatch:
+    """Test batched GH Archive verification in verify_all."""
+
+    def test_same_day_events_share_one_query(self, sample_push_event_data):
+        """Events on one day are verified by a single query and mapped back by key."""
+        events = []
+        for i, minute in enumerate(("2025-07-13T20:37:04Z", "2025-07-13T21:05:00Z")):
+            sample_push_event_data["evidence_id"] = f"push-{i}"
+            sample_push_event_data["when"] = minute
+            events.append(load_evidence_from_json(sample_push_event_data))
+
+        gharchive = FakeGHArchiveClient(existing={("aws/aws-toolkit-vscode", "testuser", "202507132037")})
+        verifier = ConsistencyVerifier(github_client=FakeGitHubClient(), gharchive_client=gharchive)
+
+        result = verifier.verify_all(events)
+
+        assert len(gharchive.batch_calls) == 1
+        assert result.errors == ["[push-1] No matching event found in GH Archive"]
+
+    def test_days_are_queried_separately(self, sample_push_event_data):
+        """Each daily table gets its own query."""
+        events = []
+        for i, day in enumerate(("2025-07-13T20:37:04Z", "2025-07-14T08:00:00Z")):
+            sample_push_event_data["evidence_id"] = f"push-{i}"
+            sample_push_event_data["when"] = day
+            events.append(load_evidence_from_json(sample_push_event_data))
+
+        gharchive = FakeGHArchiveClient()
+        verifier = ConsistencyVerifier(github_client=FakeGitHubClient(), gharchive_client=gharchive)
+        verifier.verify_all(events)
+
+        assert len(gharchive.batch_calls) == 2
+
+    def test_single_event_uses_existence_check(self, sample_push_event_data):
+        """Events outside the batch path are checked with event_exists()."""
+        event = load_evidence_from_json(sample_push_event_data)
+        gharchive = FakeGHArchiveClient(existing={("aws/aws-toolkit-vscode", "testuser", "202507132037")})
+        verifier = ConsistencyVerifier(github_client=FakeGitHubClient(), gharchive_client=gharchive)
+
+        assert verifier.verify(event).is_valid
+        assert gharchive.batch_calls == []
+
+    def test_minute_key_matches_strftime(self):
+        """The hand-rolled minute key is identical to the strftime format."""
+        when = datetime(987, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert consistency._gharchive_minute(when) == "098701020304"
+        assert consistency._gharchive_minute(when.replace(year=2025)) == when.replace(year=2025).strftime("%Y%m%d%H%M")
+
+    def test_missing_credentials_probed_once(self, sample_push_event_data):
+        """Unavailable credentials are remembered across events."""
+        event = load_evidence_from_json(sample_push_event_data)
+        gharchive = FakeGHArchiveClient(credentials=False)
+        verifier = ConsistencyVerifier(github_client=FakeGitHubClient(), gharchive_client=gharchive)
+
+        for _ in range(3):
+            result = verifier.verify(event)
+        # A second verifier over the same client reuses the remembered outcome
+        ConsistencyVerifier(github_client=FakeGitHubClient(), gharchive_client=gharchive).verify(event)
+
+        assert result.is_valid
+        assert "skipped" in result.errors[0]
+        assert gharchive.credential_probes == 1
+
+
+# =============================================================================
+# CLIENT DEFAULTS
+# =============================================================================
+
+
+class TestDefaultClients:
+    """Test shared default clients."""
+
+    def test_default_clients_are_shared(self):
+        """Verifiers without explicit clients reuse one instance of each."""
+        v1, v2 = ConsistencyVerifier(), ConsistencyVerifier()
+        assert v1.github_client is v2.github_client
+        assert v1.gharchive_client is v2.gharchive_client
+
+    def test_default_clients_built_once_under_concurrency(self, monkeypatch):
+        """Racing first calls still share a single default client."""
+        monkeypatch.setattr(consistency, "_DEFAULT_GITHUB_CLIENT", None)
+        barrier = threading.Barrier(8)
+
+        def build():
+            barrier.wait()
+            return consistency._get_github_client()
+
+        clients = []
+        threads = [threading.Thread(target=lambda: clients.append(build())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(c) for c in clients}) == 1
+
+    def test_session_built_once_and_pooled(self, monkeypatch):
+        """The URL-check session is created lazily and mounted for both schemes."""
+        monkeypatch.setattr(consistency, "_SESSION", None)
+
+        session = consistency._get_session()
+
+        assert consistency._get_session() is session
+        for prefix in ("http://", "https://"):
+            adapter = session.get_adapter(prefix + "example.com")
+            assert adapter.max_retries.total == 3
+            assert 429 in adapter.max_retries.status_forcelist
+
+    def test_head_cache_is_opt_in(self, monkeypatch):
+        """Without the opt-in variable, HEAD checks use the uncached session."""
+        monkeypatch.delenv(consistency._HTTP_CACHE_ENV, raising=False)
+        monkeypatch.setattr(consistency, "_SESSION", None)
+
+        assert consistency._get_head_session() is consistency._get_session()
+
+    def test_head_cache_only_stores_head(self, monkeypatch, tmp_path):
+        """When opted in, only HEAD responses are cached, with a short expiry."""
+        requests_cache = pytest.importorskip("requests_cache")
+        monkeypatch.setenv(consistency._HTTP_CACHE_ENV, "1")
+        monkeypatch.setattr(consistency, "_CACHED_SESSION", None)
+        monkeypatch.setattr(consistency, "_HTTP_CACHE_NAME", str(tmp_path / "verify"))
+
+        session = consistency._get_head_session()
+
+        assert isinstance(session, requests_cache.CachedSession)
+        assert session.settings.allowable_methods == ("HEAD",)
+        assert session.settings.expire_after == consistency._HTTP_CACHE_EXPIRE_AFTER
+        assert session.get_adapter("https://example.com").max_retries.total == 3
+        assert consistency._get_session() is not session
+
+    def test_head_cache_ignores_long_max_age(self, monkeypatch, tmp_path):
+        """A week-long Cache-Control max-age still expires after one hour."""
+        pytest.importorskip("requests_cache")
+        monkeypatch.setenv(consistency._HTTP_CACHE_ENV, "1")
+        monkeypatch.setattr(consistency, "_CACHED_SESSION", None)
+        monkeypatch.setattr(consistency, "_HTTP_CACHE_NAME", str(tmp_path / "verify"))
+
+        class LongLivedAdapter(HTTPAdapter):
+            def send(self, request, **kwargs):
+                raw = HTTPResponse(
+                    body=io.BytesIO(b""), headers={"Cache-Control": "max-age=604800"},
+                    status=200, preload_content=False, request_url=request.url,
+                )
+                return self.build_response(request, raw)
+
+        session = consistency._get_head_session()
+        session.mount("https://", LongLivedAdapter())
+        response = session.head("https://vendor.example.com/report")
+
+        assert response.expires - datetime.now(timezone.utc) <= timedelta(hours=1)
+
+
+# =============================================================================
+# URL / VENDOR VERIFICATION
+# =============================================================================
+
+
+class TestVendorVerification:
+    """Test security vendor and URL checks over the shared session."""
+
+    def test_ioc_found_in_page(self, monkeypatch, sample_ioc_data):
+        """IOC value is matched case-insensitively against the page."""
+        ioc = load_evidence_from_json(sample_ioc_data)
+        url = str(ioc.verification.url)
+        session = FakeSession({url: FakeResponse(text=f"<p>{ioc.value.upper()}</p>")})
+        monkeypatch.setattr(consistency, "_SESSION", session)
+
+        result = ConsistencyVerifier(github_client=FakeGitHubClient()).verify(ioc)
+
+        assert result.is_valid
+        assert session.calls == [("GET", url)]
+
+    def test_needle_matcher_reports_each_match(self, monkeypatch):
+        """Multi-pattern matching finds every present needle, with or without pyahocorasick."""
+        haystack = "payload fetched from EVIL.Example.com and 10.0.0.1"
+        needles = {"evil.example.com", "10.0.0.1", "absent.example.org"}
+
+        for available in (consistency.AHOCORASICK_AVAILABLE, False):
+            monkeypatch.setattr(consistency, "AHOCORASICK_AVAILABLE", available)
+            assert consistency._needle_matcher(needles)(haystack) == {"evil.example.com", "10.0.0.1"}
+
+    def test_ioc_missing_from_page(self, monkeypatch, sample_ioc_data):
+        """IOC absent from the page fails verification."""
+        ioc = load_evidence_from_json(sample_ioc_data)
+        session = FakeSession({str(ioc.verification.url): FakeResponse(text="nothing here")})
+        monkeypatch.setattr(consistency, "_SESSION", session)
+
+        result = ConsistencyVerifier(github_client=FakeGitHubClient()).verify(ioc)
+
+        assert not result.is_valid
+        assert "not found in source" in result.errors[0]
+
+    def test_url_error_status(self, monkeypatch, sample_ioc_data):
+        """HTTP errors are reported as fetch failures."""
+        ioc = load_evidence_from_json(sample_ioc_data)
+        session = FakeSession({str(ioc.verification.url): FakeResponse(status_code=404)})
+        monkeypatch.setattr(consistency, "_SESSION", session)
+
+        result = ConsistencyVerifier(github_client=FakeGitHubClient()).verify(ioc)
+
+        assert not result.is_valid
+        assert "Failed to fetch source URL" in result.errors[0]
+
+    def test_url_check_uses_head(self, monkeypatch, sample_commit_observation_data):
+        """Accessibility checks send HEAD and skip the body."""
+        sample_commit_observation_data["observation_type"] = "fork"
+        sample_commit_observation_data["fork_full_name"] = "someone/aws-toolkit-vscode"
+        fork = load_evidence_from_json(sample_commit_observation_data)
+        url = str(fork.verification.url)
+        session = FakeSession({url: FakeResponse()})
+        monkeypatch.setattr(consistency, "_SESSION", session)
+
+        assert ConsistencyVerifier(github_client=FakeGitHubClient()).verify(fork).is_valid
+        assert session.calls == [("HEAD", url)]
+
+    def test_wayback_snapshot_checks_verification_url(self, monkeypatch):
+        """Snapshot observations HEAD their own URL; "no captures" is not a failure."""
+        snapshot = load_evidence_from_json({
+            "observation_type": "snapshot",
+            "evidence_id": "snapshot-test-001",
+            "observed_when": "2025-07-24T12:00:00Z",
+            "observed_by": "wayback",
+            "observed_what": "No captures of deleted repository page",
+            "verification": {
+                "source": "wayback",
+                "url": "https://web.archive.org/web/*/github.com/someone/gone*",
+            },
+            "original_url": "https://github.com/someone/gone",
+            "snapshots": [],
+            "total_snapshots": 0,
+        })
+        url = str(snapshot.verification.url)
+        session = FakeSession({url: FakeResponse()})
+        monkeypatch.setattr(consistency, "_SESSION", session)
+
+        assert ConsistencyVerifier(github_client=FakeGitHubClient()).verify(snapshot).is_valid
+        assert session.calls == [("HEAD", url)]
+
+    @pytest.mark.parametrize("head_status", [405, 501])
+    def test_url_check_falls_back_to_get(self, monkeypatch, sample_commit_observation_data, head_status):
+        """Servers rejecting HEAD are retried with GET."""
+        sample_commit_observation_data["observation_type"] = "fork"
+        sample_commit_observation_data["fork_full_name"] = "someone/aws-toolkit-vscode"
+        fork = load_evidence_from_json(sample_commit_observation_data)
+        url = str(fork.verification.url)
+        session = FakeSession({url: FakeResponse()}, head_status=head_status)
+        monkeypatch.setattr(consistency, "_SESSION", session)
+
+        assert ConsistencyVerifier(github_client=FakeGitHubClient()).verify(fork).is_valid
+        assert session.calls == [("HEAD", url), ("GET", url)]
+
+    def test_page_fetched_once_for_many_iocs(self, monkeypatch, sample_ioc_data):
+        """IOCs citing the same report share one fetch."""
+        iocs = []
+        for value in ("evil.example.com", "10.0.0.1"):
+            sample_ioc_data["value"] = value
+            iocs.append(load_evidence_from_json(sample_ioc_data))
+        url = str(iocs[0].verification.url)
+        session = FakeSession({url: FakeResponse(text="c2 evil.example.com at 10.0.0.1")})
+        monkeypatch.setattr(consistency, "_SESSION", session)
+
+        result = ConsistencyVerifier(github_client=FakeGitHubClient()).verify_all(iocs)
+
+        assert result.is_valid
+        assert session.calls == [("GET", url)]
+
+    def test_scan_matches_across_chunk_boundaries(self, monkeypatch):
+        """Needles split between chunks are found via the overlap tail."""
+        url = "https://vendor.example.com/report"
+        page = FakeResponse(text="xxxxxxEVIL.example.COM yyyy 10.0.0.1 zz")
+        monkeypatch.setattr(consistency, "_SESSION", FakeSession({url: page}))
+        monkeypatch.setattr(consistency, "_SCAN_CHUNK_SIZE", 4)
+
+        found = consistency._scan_page(url, frozenset({"evil.example.com", "10.0.0.1", "absent"}))
+
+        assert found == {"evil.example.com", "10.0.0.1"}
+
+    def test_scan_cached_by_url(self, monkeypatch):
+        """Needles already searched on a URL are answered without refetching."""
+        url = "https://vendor.example.com/report"
+        session = FakeSession({url: FakeResponse(text="c2 evil.example.com at 10.0.0.1")})
+        monkeypatch.setattr(consistency, "_SESSION", session)
+
+        assert consistency._scan_page(url, frozenset({"evil.example.com"})) == {"evil.example.com"}
+        assert consistency._scan_page(url, frozenset({"absent", "10.0.0.1"})) == {"10.0.0.1"}
+        assert consistency._scan_page(url, frozenset({"evil.example.com", "absent"})) == {"evil.example.com"}
+        assert session.calls == [("GET", url), ("GET", url)]
+
+    def test_scan_unknown_charset_falls_back_to_utf8(self, monkeypatch):
+        """A charset label Python does not know is decoded as utf-8."""
+        url = "https://vendor.example.com/report"
+        page = FakeResponse(text="c2 evil.example.com")
+        page.encoding = "x-unknown-charset"
+        page.iter_content = lambda chunk_size=1: iter(["c2 evil.example.com".encode()])
+        monkeypatch.setattr(consistency, "_SESSION", FakeSession({url: page}))
+
+        assert consistency._scan_page(url, frozenset({"evil.example.com"})) == {"evil.example.com"}
+
+    def test_scan_stops_once_all_found(self, monkeypatch):
+        """The body is not read past the point where every needle matched."""
+        url = "https://vendor.example.com/report"
+        page = FakeResponse(text="10.0.0.1" + "padding " * 100)
+        monkeypatch.setattr(consistency, "_SESSION", FakeSession({url: page}))
+        monkeypatch.setattr(consistency, "_SCAN_CHUNK_SIZE", 8)
+
+        assert consistency._scan_page(url, frozenset({"10.0.0.1"})) == {"10.0.0.1"}
+        assert page.chunks_read == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])